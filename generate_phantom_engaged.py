@@ -15,13 +15,18 @@ tracking link (Approach-A after the A/B/C framework, and Approach-C
 retained but is no longer rendered anywhere in the document.
 """
 
+import functools
 import sys
-import os
+from pathlib import Path
 
 # ============================================================
 # CONFIGURATION — change the default URL here if you like
 # ============================================================
-TOOL_URL = sys.argv[1] if len(sys.argv) > 1 else "https://expert.email/classify"
+try:
+    TOOL_URL = sys.argv[1]
+except IndexError:
+    TOOL_URL = "https://expert.email/classify"
+TOOL_URL = sys.intern(TOOL_URL)
 VERSION  = "4.0"
 DATE     = "February 2026"
 OUTPUT   = "Phantom_Engaged_v5.pdf"
@@ -38,8 +43,6 @@ from reportlab.platypus import (
 )
 from reportlab.platypus.doctemplate import PageTemplate, BaseDocTemplate
 from reportlab.platypus.frames import Frame
-from reportlab.graphics.shapes import Drawing, Rect, Line, String
-from reportlab.graphics import renderPDF
 
 # ── Colour palette (matched to v4) ────────────────────────────
 COVER_BG    = HexColor("#2D3E4D")
@@ -51,8 +54,18 @@ CALLOUT_BG   = HexColor("#F0F5F5")
 TABLE_HDR    = HexColor("#2D3E4D")
 TABLE_ALT    = HexColor("#F7FAFA")
 LINK_COLOR   = HexColor("#3B9B8F")
+GRID_LINE    = HexColor("#D8DFE3")
+DIAGRAM_FILL = HexColor("#D0EDEA")
+# Cover page tones
+COVER_SUBTITLE   = HexColor("#8FA8B8")
+COVER_RULE       = HexColor("#4A6070")
+COVER_CALLOUT_BG = HexColor("#253545")
+COVER_CALLOUT_TX = HexColor("#B0C4CE")
+COVER_FINE_PRINT = HexColor("#607080")
 
 W, H = letter  # 612 x 792
+MARGIN = inch * 0.85
+AVAIL_W = W - MARGIN * 2
 
 # ── Paragraph styles ──────────────────────────────────────────
 sNormal = ParagraphStyle(
@@ -116,7 +129,100 @@ sLinkStyle = ParagraphStyle(
 )
 
 
+# ── Table styles ──────────────────────────────────────────────
+# Header band, alternating rows, padding and grid shared by both tables
+_TABLE_BASE_CMDS = [
+    ('BACKGROUND', (0, 0), (-1, 0), TABLE_HDR),
+    ('TEXTCOLOR', (0, 0), (-1, 0), white),
+    ('BACKGROUND', (0, 1), (-1, 1), TABLE_ALT),
+    ('BACKGROUND', (0, 3), (-1, 3), TABLE_ALT),
+    ('LEFTPADDING', (0, 0), (-1, -1), 8),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 0.4, GRID_LINE),
+]
+_SIG_TABLE_STYLE = TableStyle(_TABLE_BASE_CMDS + [
+    ('BACKGROUND', (0, 5), (-1, 5), TABLE_ALT),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+])
+_ABC_TABLE_STYLE = TableStyle(_TABLE_BASE_CMDS + [
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+])
+
+# Cell text for the two tables; the builders add the markup and styles
+_SIG_HEADERS = ("Signal", "Pre-Privacy Implication", "Post-Privacy Reality")
+_SIG_ROWS = (
+    ("Open", "A person likely viewed the email.",
+     "Often means the client fetched images. May happen without a human reading."),
+    ("No open", "A person likely did not view the email.",
+     "Could be a non-reader, or a reader whose client blocks tracking."),
+    ("Click", "A person intentionally acted.",
+     "Still the cleanest in-email proof of intent. Not perfect, but far stronger than opens."),
+    ("Reply", "A person intentionally engaged.",
+     "High-confidence intent signal. May bypass link blockers and tracking limitations."),
+    ("Purchase / login", "Downstream proof of value.",
+     "Best proof if you can connect it. The gold standard for classification."),
+)
+_ABC_HEADERS = ("", "Classification", "Signals", "Treatment")
+_ABC_ROWS = (
+    ("A", "Confirmed Intent",
+     "Clicks, replies, purchases, logins, downstream events. Opens optional.",
+     "Send with confidence. These subscribers have demonstrated attention."),
+    ("B", "Phantom (Uncertain)",
+     "Opens present. No intentional actions. Ambiguous by design.",
+     "Handle conservatively. This is a holding state, not a verdict."),
+    ("C", "Unengaged (Observable)",
+     "No opens, clicks, replies, or downstream actions within a defined window.",
+     "Eligible for controlled, finite re-engagement. Safest to suppress or sunset. "
+     "Clearest candidates for removal."),
+)
+
+
 # ── Custom flowables ──────────────────────────────────────────
+# Parsed markup keyed by (text, style, bulletText), and line-break results
+# keyed by the same plus the wrap width.
+_FRAG_CACHE = {}
+_WRAP_CACHE = {}
+
+
+class CachedParagraph(Paragraph):
+    """Paragraph that reuses the parse and line breaks of identical text.
+
+    The markup of a given text/style pair is parsed once; later instances
+    are built straight from the cached frags. Platypus also wraps the same
+    paragraph several times (KeepTogether probes, frame placement, callout
+    measuring), always at the same width.
+    """
+    def __init__(self, text, style=None, bulletText=None, frags=None, **kw):
+        # Split halves are rebuilt from frags and have no text to key on
+        self._wrap_key = hit = None
+        if frags is None:
+            self._wrap_key = (text, id(style), bulletText)
+            hit = _FRAG_CACHE.get(self._wrap_key)
+            if hit is not None:
+                style, frags, bulletText = hit
+        Paragraph.__init__(self, text, style, bulletText, frags, **kw)
+        if self._wrap_key is not None and hit is None:
+            _FRAG_CACHE[self._wrap_key] = (self.style, self.frags, self.bulletText)
+
+    def wrap(self, availWidth, availHeight):
+        if self._wrap_key is None:
+            return Paragraph.wrap(self, availWidth, availHeight)
+        key = self._wrap_key + (round(availWidth, 2),)
+        hit = _WRAP_CACHE.get(key)
+        if hit is not None:
+            self._wrapWidths, self.blPara, self.frags, self.height = hit
+            self.width = availWidth
+            return self.width, self.height
+        w, h = Paragraph.wrap(self, availWidth, availHeight)
+        if w:
+            _WRAP_CACHE[key] = (self._wrapWidths, self.blPara, self.frags, h)
+        return w, h
+
+
 class TealRule(Flowable):
     """Horizontal teal line under section headers."""
     def __init__(self, width):
@@ -141,18 +247,15 @@ class CalloutBox(Flowable):
         self.avail_width = avail_width
         if style is None:
             style = sCalloutItalic
-        self.paras = []
-        for t in text_paragraphs:
-            if isinstance(t, tuple):
-                self.paras.append(Paragraph(t[0], t[1]))
-            else:
-                self.paras.append(Paragraph(t, style))
+        # Items are either plain text in the box style or (text, style)
+        self.paras = [CachedParagraph(*t) if type(t) is tuple
+                      else CachedParagraph(t, style)
+                      for t in text_paragraphs]
         inner_w = avail_width - self.bar_w - self.padding * 2
         self.inner_w = inner_w
-        total_h = 0
-        for para in self.paras:
-            _, ph = para.wrap(inner_w, 10000)
-            total_h += ph + 4
+        # Measure once; draw() reuses these heights instead of re-wrapping
+        self._heights = [para.wrap(inner_w, 10000)[1] for para in self.paras]
+        total_h = sum(self._heights) + 4 * len(self._heights)
         self.box_h = total_h + self.padding * 2 - 4
         self.width = avail_width
         self.height = self.box_h + 8
@@ -166,8 +269,7 @@ class CalloutBox(Flowable):
         c.rect(0, y_base, self.bar_w, self.box_h, fill=1, stroke=0)
         x = self.bar_w + self.padding
         y = y_base + self.box_h - self.padding
-        for para in self.paras:
-            _, ph = para.wrap(self.inner_w, 10000)
+        for para, ph in zip(self.paras, self._heights):
             para.drawOn(c, x, y - ph)
             y -= ph + 4
 
@@ -175,80 +277,88 @@ class CalloutBox(Flowable):
 class OverlapDiagram(Flowable):
     """The Phantom Engaged overlap visualization — matched to v4.
 
-    Uses reportlab.graphics Drawing/shapes for reliable fill rendering.
+    Drawn straight onto the canvas; the layers are painted in order so the
+    white right-hand fill sits between the teal fill and the border. The
+    operators are recorded once per document as a form XObject and every
+    draw references it.
     """
+    BOX_H = 38
+    BOX_Y = 28
+    RADIUS = 4
+    LINE_W = 1.2
+
     def __init__(self, avail_width):
         Flowable.__init__(self)
         self.width = avail_width
         self.height = 120
 
-    def draw(self):
-        W = self.width
-        H = self.height
-        d = Drawing(W, H)
-
-        cx = W / 2
-        box_w = W * 0.82
-        box_h = 38
+        # The width-dependent geometry only needs working out once
+        cx = avail_width / 2
+        box_w = avail_width * 0.82
         box_x = cx - box_w / 2
-        box_y = 28
-        r = 4
-        dash_x = box_x + box_w * 0.72
-        lw = 1.2
+        self._geom = (cx, box_w, box_x, box_x + box_w * 0.72)
+
+    def draw(self):
+        c = self.canv
+        name = "overlapDiag%d" % round(self.width * 10)
+        if not c.hasForm(name):
+            # Bottom caption sits just below y=0; leave room for descenders
+            c.beginForm(name, lowerx=0, lowery=-12,
+                        upperx=self.width, uppery=self.height)
+            self._paint(c)
+            c.endForm()
+        c.doForm(name)
+
+    def _paint(self, c):
+        cx, box_w, box_x, dash_x = self._geom
+        box_h, box_y, r, lw = self.BOX_H, self.BOX_Y, self.RADIUS, self.LINE_W
 
         # Layer 1: Full teal-filled rounded rect (whole box)
-        d.add(Rect(box_x, box_y, box_w, box_h, rx=r, ry=r,
-                   fillColor=HexColor("#D0EDEA"),
-                   strokeColor=None, strokeWidth=0))
+        c.setFillColor(DIAGRAM_FILL)
+        c.roundRect(box_x, box_y, box_w, box_h, r, fill=1, stroke=0)
 
         # Layer 2: White rect over the right portion (dash_x to right edge)
-        d.add(Rect(dash_x, box_y + lw/2,
-                   (box_x + box_w - r) - dash_x, box_h - lw,
-                   fillColor=white, strokeColor=None, strokeWidth=0))
+        c.setFillColor(white)
+        c.rect(dash_x, box_y + lw/2, (box_x + box_w - r) - dash_x, box_h - lw,
+               fill=1, stroke=0)
 
         # Layer 3: Teal border (stroke only, no fill)
-        d.add(Rect(box_x, box_y, box_w, box_h, rx=r, ry=r,
-                   fillColor=None,
-                   strokeColor=TEAL, strokeWidth=lw))
+        c.setStrokeColor(TEAL)
+        c.setLineWidth(lw)
+        c.roundRect(box_x, box_y, box_w, box_h, r, fill=0, stroke=1)
 
         # Dashed vertical boundary line
-        d.add(Line(dash_x, box_y, dash_x, box_y + box_h,
-                   strokeColor=LIGHT_TEXT, strokeWidth=1,
-                   strokeDashArray=[4, 3]))
-
-        # "ENGAGED" label (left inside box)
-        d.add(String(box_x + 20, box_y + box_h/2 - 3, "ENGAGED",
-                     fontName="Helvetica-Bold", fontSize=10,
-                     fillColor=DARK_TEXT))
-
-        # "UNENGAGED" label (right inside box)
-        d.add(String(box_x + box_w - 20, box_y + box_h/2 - 3, "UNENGAGED",
-                     fontName="Helvetica-Bold", fontSize=10,
-                     fillColor=DARK_TEXT, textAnchor="end"))
+        c.setStrokeColor(LIGHT_TEXT)
+        c.setLineWidth(1)
+        c.setDash([4, 3])
+        c.line(dash_x, box_y, dash_x, box_y + box_h)
+        c.setDash()
+
+        # "ENGAGED" / "UNENGAGED" labels inside box
+        c.setFont("Helvetica-Bold", 10)
+        c.setFillColor(DARK_TEXT)
+        c.drawString(box_x + 20, box_y + box_h/2 - 3, "ENGAGED")
+        c.drawRightString(box_x + box_w - 20, box_y + box_h/2 - 3, "UNENGAGED")
 
         # "PHANTOM ENGAGED" label above
-        d.add(String(cx, box_y + box_h + 18, "PHANTOM ENGAGED",
-                     fontName="Helvetica-Bold", fontSize=9,
-                     fillColor=TEAL, textAnchor="middle"))
+        c.setFont("Helvetica-Bold", 9)
+        c.setFillColor(TEAL)
+        c.drawCentredString(cx, box_y + box_h + 18, "PHANTOM ENGAGED")
 
         # Arrow line down to box
-        d.add(Line(cx, box_y + box_h + 16, cx, box_y + box_h + 2,
-                   strokeColor=DARK_TEXT, strokeWidth=0.8))
+        c.setStrokeColor(DARK_TEXT)
+        c.setLineWidth(0.8)
+        c.line(cx, box_y + box_h + 16, cx, box_y + box_h + 2)
 
         # Subtitle lines below diagram
-        d.add(String(cx, box_y - 8, "Looks engaged in reports,",
-                     fontName="Helvetica", fontSize=8,
-                     fillColor=LIGHT_TEXT, textAnchor="middle"))
-        d.add(String(cx, box_y - 18, "but attention is uncertain",
-                     fontName="Helvetica", fontSize=8,
-                     fillColor=LIGHT_TEXT, textAnchor="middle"))
-        d.add(String(cx, box_y - 32,
-                     "Privacy protections increase the overlap between what we can measure and what is real.",
-                     fontName="Helvetica-Oblique", fontSize=7.5,
-                     fillColor=MID_TEXT, textAnchor="middle"))
-
-        # Render the Drawing onto the canvas
-        renderPDF.draw(d, self.canv, 0, 0)
+        c.setFont("Helvetica", 8)
+        c.setFillColor(LIGHT_TEXT)
+        c.drawCentredString(cx, box_y - 8, "Looks engaged in reports,")
+        c.drawCentredString(cx, box_y - 18, "but attention is uncertain")
+        c.setFont("Helvetica-Oblique", 7.5)
+        c.setFillColor(MID_TEXT)
+        c.drawCentredString(cx, box_y - 32,
+            "Privacy protections increase the overlap between what we can measure and what is real.")
 
 
 # ── Page templates ────────────────────────────────────────────
@@ -271,17 +381,17 @@ class CoverPage:
         canvas.setFillColor(white)
         canvas.drawString(inch * 1.15, H - inch * 1.8, "Phantom")
         canvas.drawString(inch * 1.15, H - inch * 2.55, "Engaged")
-        # Subtitle
-        canvas.setFont("Helvetica", 13)
-        canvas.setFillColor(HexColor("#8FA8B8"))
+        # Subtitle (one text object, 17pt line spacing)
         y_sub = H - inch * 3.1
-        canvas.drawString(inch * 1.15, y_sub,
-            "A position paper on the invisible overlap between engaged")
-        canvas.drawString(inch * 1.15, y_sub - 17,
-            "and disengaged subscribers created by modern email")
-        canvas.drawString(inch * 1.15, y_sub - 34, "privacy protections")
+        t = canvas.beginText(inch * 1.15, y_sub)
+        t.setFont("Helvetica", 13, leading=17)
+        t.setFillColor(COVER_SUBTITLE)
+        t.textLine("A position paper on the invisible overlap between engaged")
+        t.textLine("and disengaged subscribers created by modern email")
+        t.textLine("privacy protections")
+        canvas.drawText(t)
         # Horizontal rule
-        canvas.setStrokeColor(HexColor("#4A6070"))
+        canvas.setStrokeColor(COVER_RULE)
         canvas.setLineWidth(0.5)
         canvas.line(inch * 1.15, y_sub - 52, W - inch * 1.0, y_sub - 52)
         # Author info
@@ -299,27 +409,30 @@ class CoverPage:
         by = inch * 1.3
         bw = W - inch * 2.15
         bh = inch * 0.95
-        canvas.setFillColor(HexColor("#253545"))
+        canvas.setFillColor(COVER_CALLOUT_BG)
         canvas.roundRect(bx, by, bw, bh, 3, fill=1, stroke=0)
         canvas.setFillColor(TEAL)
         canvas.rect(bx, by, 4, bh, fill=1, stroke=0)
-        canvas.setFont("Helvetica-Oblique", 10)
-        canvas.setFillColor(HexColor("#B0C4CE"))
-        txt1 = "When privacy protections break open tracking, a large portion of your list becomes impossible to classify using"
-        txt2 = "email analytics alone. That invisible overlap is the Phantom Engaged problem: people who look engaged in"
-        txt3 = "reports but may or may not be paying attention."
-        canvas.drawString(bx + 18, by + bh - 24, txt1)
-        canvas.drawString(bx + 18, by + bh - 39, txt2)
-        canvas.drawString(bx + 18, by + bh - 54, txt3)
+        t = canvas.beginText(bx + 18, by + bh - 24)
+        t.setFont("Helvetica-Oblique", 10, leading=15)
+        t.setFillColor(COVER_CALLOUT_TX)
+        t.textLine("When privacy protections break open tracking, a large portion of your list becomes impossible to classify using")
+        t.textLine("email analytics alone. That invisible overlap is the Phantom Engaged problem: people who look engaged in")
+        t.textLine("reports but may or may not be paying attention.")
+        canvas.drawText(t)
 
         # Copyright
         canvas.setFont("Helvetica", 8)
-        canvas.setFillColor(HexColor("#607080"))
+        canvas.setFillColor(COVER_FINE_PRINT)
         canvas.drawString(inch * 1.15, inch * 0.75,
             "\u00A9 2026 Chuck Mullaney. You may share this document in full with attribution.")
         canvas.restoreState()
 
 
+# Everything in the footer but the page number is fixed for the run
+_FOOTER_PREFIX = f"Phantom Engaged  \u2022  Position Paper v{VERSION}  \u2022  {DATE}   Page "
+
+
 class ContentPage:
     """Footer on content pages — matches v4 layout."""
     @staticmethod
@@ -328,14 +441,13 @@ class ContentPage:
         canvas.setFont("Helvetica", 7.5)
         canvas.setFillColor(LIGHT_TEXT)
         canvas.drawString(
-            inch * 0.85, inch * 0.5,
-            f"Phantom Engaged  \u2022  Position Paper v{VERSION}  \u2022  {DATE}   Page {doc.page - 1}"
+            inch * 0.85, inch * 0.5, _FOOTER_PREFIX + str(doc.page - 1)
         )
         canvas.drawRightString(
             W - inch * 0.85, inch * 0.5,
             "Chuck Mullaney \u2022 Expert.Email"
         )
-        canvas.setStrokeColor(HexColor("#D8DFE3"))
+        canvas.setStrokeColor(GRID_LINE)
         canvas.setLineWidth(0.4)
         canvas.line(inch * 0.85, inch * 0.65, W - inch * 0.85, inch * 0.65)
         canvas.restoreState()
@@ -343,17 +455,17 @@ class ContentPage:
 
 # ── Helpers ────────────────────────────────────────────────────
 def sec(title):
-    return [Paragraph(title, sH1), TealRule(W - inch * 1.7), Spacer(1, 8)]
+    return [CachedParagraph(title, sH1), TealRule(W - inch * 1.7), Spacer(1, 8)]
 
 def subsec(title):
-    return [Paragraph(title, sH2), Spacer(1, 4)]
+    return [CachedParagraph(title, sH2), Spacer(1, 4)]
 
 def h3(title):
     """Teal bold subsection header (used in Section 8)."""
-    return [Paragraph(title, sH3), Spacer(1, 4)]
+    return [CachedParagraph(title, sH3), Spacer(1, 4)]
 
 def p(text, style=sNormal):
-    return Paragraph(text, style)
+    return CachedParagraph(text, style)
 
 def sp(h=6):
     return Spacer(1, h)
@@ -362,23 +474,14 @@ def callout(texts, avail_w, style=None, bg=CALLOUT_BG):
     return CalloutBox(texts, avail_w, bg=bg, style=style)
 
 def bullet(text):
-    return Paragraph(f"\u2022  {text}", sBullet)
+    return CachedParagraph(f"\u2022  {text}", sBullet)
 
 
-# ── Build document ────────────────────────────────────────────
-def build():
-    out_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), OUTPUT)
-    margin = inch * 0.85
-    avail_w = W - margin * 2
+# ══════════════════════════════════════════════════════════
+# EXECUTIVE SUMMARY
+# ══════════════════════════════════════════════════════════
+def _exec_summary(avail_w):
     story = []
-
-    # ── Cover page placeholder ──
-    story.append(Spacer(1, H))
-    story.append(PageBreak())
-
-    # ══════════════════════════════════════════════════════════
-    # EXECUTIVE SUMMARY
-    # ══════════════════════════════════════════════════════════
     story.extend(sec("Executive Summary"))
 
     story.append(p(
@@ -419,10 +522,14 @@ def build():
         "proof of engagement, treat opens as weak evidence, and handle ambiguity conservatively to avoid "
         "irreversible harm."
     ))
+    return story
+
 
-    # ══════════════════════════════════════════════════════════
-    # SECTION 1
-    # ══════════════════════════════════════════════════════════
+# ══════════════════════════════════════════════════════════
+# SECTION 1
+# ══════════════════════════════════════════════════════════
+def _section_1(avail_w):
+    story = []
     story.extend(sec("1. What Changed in Measurement"))
 
     story.append(p(
@@ -451,10 +558,14 @@ def build():
         ("<b>The core tension:</b> <i>You are being asked to prove you send wanted mail while losing the cleanest historical "
          "proxy (opens) that many teams relied on to define \u2018wanted.\u2019</i>", sCalloutNormal)
     ], avail_w))
+    return story
+
 
-    # ══════════════════════════════════════════════════════════
-    # SECTION 2
-    # ══════════════════════════════════════════════════════════
+# ══════════════════════════════════════════════════════════
+# SECTION 2
+# ══════════════════════════════════════════════════════════
+def _section_2(avail_w):
+    story = []
     story.extend(sec("2. Why the Open Event No Longer Means Attention"))
 
     story.append(p(
@@ -465,41 +576,14 @@ def build():
     story.append(sp(10))
 
     # Signal comparison table — fixed column widths to prevent overflow
-    tdata = [
-        [Paragraph("<b>Signal</b>", sTableHdr),
-         Paragraph("<b>Pre-Privacy Implication</b>", sTableHdr),
-         Paragraph("<b>Post-Privacy Reality</b>", sTableHdr)],
-        [Paragraph("<b>Open</b>", sTableBoldCell),
-         Paragraph("A person likely viewed the email.", sTableCell),
-         Paragraph("Often means the client fetched images. May happen without a human reading.", sTableCell)],
-        [Paragraph("<b>No open</b>", sTableBoldCell),
-         Paragraph("A person likely did not view the email.", sTableCell),
-         Paragraph("Could be a non-reader, or a reader whose client blocks tracking.", sTableCell)],
-        [Paragraph("<b>Click</b>", sTableBoldCell),
-         Paragraph("A person intentionally acted.", sTableCell),
-         Paragraph("Still the cleanest in-email proof of intent. Not perfect, but far stronger than opens.", sTableCell)],
-        [Paragraph("<b>Reply</b>", sTableBoldCell),
-         Paragraph("A person intentionally engaged.", sTableCell),
-         Paragraph("High-confidence intent signal. May bypass link blockers and tracking limitations.", sTableCell)],
-        [Paragraph("<b>Purchase / login</b>", sTableBoldCell),
-         Paragraph("Downstream proof of value.", sTableCell),
-         Paragraph("Best proof if you can connect it. The gold standard for classification.", sTableCell)],
-    ]
+    tdata = [[CachedParagraph("<b>%s</b>" % h, sTableHdr) for h in _SIG_HEADERS]]
+    tdata += [[CachedParagraph("<b>%s</b>" % sig, sTableBoldCell),
+               CachedParagraph(pre, sTableCell),
+               CachedParagraph(post, sTableCell)]
+              for sig, pre, post in _SIG_ROWS]
     col_w = [avail_w * 0.15, avail_w * 0.35, avail_w * 0.50]
     t = Table(tdata, colWidths=col_w, repeatRows=1)
-    t.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), TABLE_HDR),
-        ('TEXTCOLOR', (0, 0), (-1, 0), white),
-        ('BACKGROUND', (0, 1), (-1, 1), TABLE_ALT),
-        ('BACKGROUND', (0, 3), (-1, 3), TABLE_ALT),
-        ('BACKGROUND', (0, 5), (-1, 5), TABLE_ALT),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.4, HexColor("#D8DFE3")),
-    ]))
+    t.setStyle(_SIG_TABLE_STYLE)
     story.append(t)
     story.append(sp(10))
 
@@ -507,10 +591,14 @@ def build():
         "If you take one thing from this paper, take this: opens are now evidence that something rendered remote "
         "content, not evidence that a person noticed, read, agreed, or wanted more."
     ], avail_w))
+    return story
+
 
-    # ══════════════════════════════════════════════════════════
-    # SECTION 3
-    # ══════════════════════════════════════════════════════════
+# ══════════════════════════════════════════════════════════
+# SECTION 3
+# ══════════════════════════════════════════════════════════
+def _section_3(avail_w):
+    story = []
     story.extend(sec("3. The Phantom Engaged Overlap"))
 
     story.append(p(
@@ -528,10 +616,14 @@ def build():
         "uncertainty. Attempting to force certainty (for example, by treating opens as attention regardless) is "
         "where most classification mistakes begin."
     ))
+    return story
+
 
-    # ══════════════════════════════════════════════════════════
-    # SECTION 4
-    # ══════════════════════════════════════════════════════════
+# ══════════════════════════════════════════════════════════
+# SECTION 4
+# ══════════════════════════════════════════════════════════
+def _section_4(avail_w):
+    story = []
     story.extend(sec("4. A Classification Framework That Admits Uncertainty"))
 
     story.append(p(
@@ -543,38 +635,17 @@ def build():
     story.append(sp(10))
 
     # A/B/C classification table — fixed column widths
-    abc_data = [
-        [Paragraph("", sTableHdr),
-         Paragraph("<b>Classification</b>", sTableHdr),
-         Paragraph("<b>Signals</b>", sTableHdr),
-         Paragraph("<b>Treatment</b>", sTableHdr)],
-        [Paragraph("<b><font size='16' color='#3B9B8F'>A</font></b>", sTableBoldCell),
-         Paragraph("<b>Confirmed Intent</b>", sTableBoldCell),
-         Paragraph("Clicks, replies, purchases, logins, downstream events. Opens optional.", sTableCell),
-         Paragraph("Send with confidence. These subscribers have demonstrated attention.", sTableCell)],
-        [Paragraph("<b><font size='16' color='#3B9B8F'>B</font></b>", sTableBoldCell),
-         Paragraph("<b>Phantom (Uncertain)</b>", sTableBoldCell),
-         Paragraph("Opens present. No intentional actions. Ambiguous by design.", sTableCell),
-         Paragraph("Handle conservatively. This is a holding state, not a verdict.", sTableCell)],
-        [Paragraph("<b><font size='16' color='#3B9B8F'>C</font></b>", sTableBoldCell),
-         Paragraph("<b>Unengaged (Observable)</b>", sTableBoldCell),
-         Paragraph("No opens, clicks, replies, or downstream actions within a defined window.", sTableCell),
-         Paragraph("Eligible for controlled, finite re-engagement. Safest to suppress or sunset. Clearest candidates for removal.", sTableCell)],
-    ]
+    abc_data = [[CachedParagraph("<b>%s</b>" % h if h else "", sTableHdr)
+                 for h in _ABC_HEADERS]]
+    abc_data += [[CachedParagraph("<b><font size='16' color='#3B9B8F'>%s</font></b>" % tier,
+                                  sTableBoldCell),
+                  CachedParagraph("<b>%s</b>" % name, sTableBoldCell),
+                  CachedParagraph(signals, sTableCell),
+                  CachedParagraph(treatment, sTableCell)]
+                 for tier, name, signals, treatment in _ABC_ROWS]
     abc_col = [avail_w * 0.06, avail_w * 0.18, avail_w * 0.38, avail_w * 0.38]
     at = Table(abc_data, colWidths=abc_col, repeatRows=1)
-    at.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), TABLE_HDR),
-        ('TEXTCOLOR', (0, 0), (-1, 0), white),
-        ('BACKGROUND', (0, 1), (-1, 1), TABLE_ALT),
-        ('BACKGROUND', (0, 3), (-1, 3), TABLE_ALT),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.4, HexColor("#D8DFE3")),
-    ]))
+    at.setStyle(_ABC_TABLE_STYLE)
     story.append(at)
     story.append(sp(10))
 
@@ -584,12 +655,16 @@ def build():
         "Treating it as anything else defeats its purpose."
     ))
     story.append(sp(10))
+    return story
 
-    # ══════════════════════════════════════════════════════════
-    # (APPROACH A free-tool callout removed 2026-07-30)
-    # ══════════════════════════════════════════════════════════
-    # SECTION 5
-    # ══════════════════════════════════════════════════════════
+
+# ══════════════════════════════════════════════════════════
+# (APPROACH A free-tool callout removed 2026-07-30)
+# ══════════════════════════════════════════════════════════
+# SECTION 5
+# ══════════════════════════════════════════════════════════
+def _section_5(avail_w):
+    story = []
     story.extend(sec("5. What Goes Wrong When You Ignore the Uncertainty"))
 
     story.append(p(
@@ -632,10 +707,14 @@ def build():
         "important decisions are about what you choose <b>not</b> to do when you cannot know the full truth from email "
         "metrics alone."
     ], avail_w))
+    return story
 
-    # ══════════════════════════════════════════════════════════
-    # SECTION 6
-    # ══════════════════════════════════════════════════════════
+
+# ══════════════════════════════════════════════════════════
+# SECTION 6
+# ══════════════════════════════════════════════════════════
+def _section_6(avail_w):
+    story = []
     story.extend(sec("6. Principles for Working Marketers"))
 
     story.append(p(
@@ -683,10 +762,14 @@ def build():
         "people into a different sending cadence are all reversible. Suppression and permanent removal are not. "
         "Save irreversible decisions for situations where you have high confidence."
     ))
+    return story
 
-    # ══════════════════════════════════════════════════════════
-    # SECTION 7
-    # ══════════════════════════════════════════════════════════
+
+# ══════════════════════════════════════════════════════════
+# SECTION 7
+# ══════════════════════════════════════════════════════════
+def _section_7(avail_w):
+    story = []
     story.extend(sec("7. A Note on Ethics and Privacy"))
 
     story.append(p(
@@ -721,10 +804,14 @@ def build():
         "authentication requirements, and lower tolerance for unwanted mail. <super>[4][5]</super> Working with that "
         "trajectory, rather than against it, is both the ethical choice and the practical one."
     ))
+    return story
 
-    # ══════════════════════════════════════════════════════════
-    # SECTION 8
-    # ══════════════════════════════════════════════════════════
+
+# ══════════════════════════════════════════════════════════
+# SECTION 8
+# ══════════════════════════════════════════════════════════
+def _section_8(avail_w):
+    story = []
     story.extend(sec("8. What Competent Teams Do Next"))
 
     story.append(p(
@@ -770,10 +857,14 @@ def build():
         "product usage. This is not about surveilling individuals. It is about ensuring you are not mistaking a "
         "privacy artifact for actual disengagement."
     ))
+    return story
 
-    # ══════════════════════════════════════════════════════════
-    # CONCLUSION
-    # ══════════════════════════════════════════════════════════
+
+# ══════════════════════════════════════════════════════════
+# CONCLUSION
+# ══════════════════════════════════════════════════════════
+def _conclusion(avail_w):
+    story = []
     story.extend(sec("Conclusion"))
 
     story.append(p(
@@ -796,16 +887,20 @@ def build():
     ]
     story.append(callout(final_callout, avail_w))
     story.append(sp(16))
+    return story
 
-    # ══════════════════════════════════════════════════════════
-    # (APPROACH C "Put This Into Practice" free-tool section removed 2026-07-30)
-    # ══════════════════════════════════════════════════════════
 
-    # ══════════════════════════════════════════════════════════
-    # REFERENCES (kept together to prevent orphaned refs)
-    # ══════════════════════════════════════════════════════════
+# ══════════════════════════════════════════════════════════
+# (APPROACH C "Put This Into Practice" free-tool section removed 2026-07-30)
+# ══════════════════════════════════════════════════════════
+
+# ══════════════════════════════════════════════════════════
+# REFERENCES (kept together to prevent orphaned refs)
+# ══════════════════════════════════════════════════════════
+def _references(avail_w):
+    story = []
     refs_block = [TealRule(avail_w), sp(12)]
-    refs_block.append(Paragraph("<b>References</b>", sH2))
+    refs_block.append(CachedParagraph("<b>References</b>", sH2))
     refs_block.append(sp(6))
 
     refs = [
@@ -816,17 +911,21 @@ def build():
         '[5] Yahoo. "Sender Best Practices" (includes one-click unsubscribe guidance and processing expectations). senders.yahooinc.com/best-practices/',
     ]
     for r in refs:
-        refs_block.append(Paragraph(r, sRef))
+        refs_block.append(CachedParagraph(r, sRef))
 
     story.append(KeepTogether(refs_block))
+    return story
 
-    # ══════════════════════════════════════════════════════════
-    # ABOUT THE AUTHOR
-    # ══════════════════════════════════════════════════════════
+
+# ══════════════════════════════════════════════════════════
+# ABOUT THE AUTHOR
+# ══════════════════════════════════════════════════════════
+def _about_author(avail_w):
+    story = []
     story.append(sp(8))
     story.append(TealRule(avail_w))
     story.append(sp(12))
-    story.append(Paragraph("<b>About the Author</b>", sH2))
+    story.append(CachedParagraph("<b>About the Author</b>", sH2))
     story.append(sp(6))
 
     story.append(p(
@@ -847,12 +946,43 @@ def build():
     story.append(p(
         f'<font color="{TEAL.hexval()}">Contact: chuck@expert.email  \u2022  Web: Expert.Email</font>'
     ))
+    return story
+
+
+_SECTIONS = (
+    _exec_summary, _section_1, _section_2, _section_3,
+    _section_4, _section_5, _section_6, _section_7,
+    _section_8, _conclusion, _references, _about_author,
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _static_story_parts():
+    """Cover placeholder plus the full body, built on first use.
+
+    Nothing in the story depends on TOOL_URL any more (see the module
+    NOTE), so the whole document is static and later builds reuse it.
+    """
+    # Cover page placeholder, then switch to content pages
+    story = [Spacer(1, H), NextPageTemplate('Content'), PageBreak()]
+    for section in _SECTIONS:
+        story.extend(section(AVAIL_W))
+    return tuple(story)
+
+
+# ── Build document ────────────────────────────────────────────
+# The PDF is written next to this script, wherever it is run from
+_OUT_PATH = str(Path(__file__).resolve().parent / OUTPUT)
+
+
+def build():
+    out_path = _OUT_PATH
 
     # ── Build with page templates ─────────────────────────────
     class PhantomDoc(BaseDocTemplate):
         def __init__(self, filename, **kwargs):
             BaseDocTemplate.__init__(self, filename, **kwargs)
-            frame = Frame(margin, inch * 0.85, avail_w, H - inch * 1.6,
+            frame = Frame(MARGIN, inch * 0.85, AVAIL_W, H - inch * 1.6,
                           id='normal')
             cover_frame = Frame(0, 0, W, H, id='cover',
                                 leftPadding=0, rightPadding=0,
@@ -862,13 +992,19 @@ def build():
                 PageTemplate(id='Content', frames=frame, onPage=ContentPage.draw),
             ])
 
-    doc = PhantomDoc(out_path, pagesize=letter)
+        def build(self, flowables, **kw):
+            # The static story (and the references inside its KeepTogether)
+            # is reused, so reset any postponed marks from an earlier build
+            for f in flowables:
+                f.__dict__.pop('_postponed', None)
+                for child in getattr(f, '_content', ()):
+                    child.__dict__.pop('_postponed', None)
+            BaseDocTemplate.build(self, flowables, **kw)
 
-    final_story = [story[0]]  # Cover spacer
-    final_story.append(NextPageTemplate('Content'))
-    final_story.extend(story[1:])
+    # Canvas settings as in the whitepaper generators
+    doc = PhantomDoc(out_path, pagesize=letter, pageCompression=1, invariant=1)
 
-    doc.build(final_story)
+    doc.build(list(_static_story_parts()))
     print(f"\n  Generated: {out_path}")
     print(f"  URL used:  {TOOL_URL}")
     print(f"  To customise for a partner, run:")
@@ -6,7 +6,7 @@ Design match: landing page (index.html)
 Style: Professional White Paper / Report
 """
 
-import os
+from reportlab import rl_config
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
 from reportlab.lib.colors import HexColor, white, black, Color
@@ -16,8 +16,7 @@ from reportlab.platypus import (
     Paragraph, Spacer, PageBreak, Flowable, Frame, 
     BaseDocTemplate, PageTemplate, NextPageTemplate
 )
-from reportlab.graphics.shapes import Drawing, Rect, Line, String
-from reportlab.graphics import renderPDF
+rl_config.useA85 = 0      # binary streams, not ASCII85 text
 
 # ── Design Tokens (from index.html) ──────────────────────────
 DARK_BG     = HexColor("#1C2A3A")
@@ -26,6 +25,7 @@ TEAL_MUTED  = HexColor("#EBF6F6")  # Light version of teal for callout BG
 TEXT_BODY   = HexColor("#2D3E50")
 TEXT_MUTED  = HexColor("#8A9BB5")
 OFF_WHITE   = HexColor("#F7F8FA")
+_TEAL_HEX   = TEAL.hexval()  # for inline <font color=...> markup
 
 # ── Dimensions ───────────────────────────────────────────────
 W, H = letter
@@ -101,34 +101,76 @@ class OverlapDiagram(Flowable):
         Flowable.__init__(self)
         self.width = width
         self.height = 100
-    
+
     def draw(self):
-        d = Drawing(self.width, self.height)
+        # Straight onto the canvas: three bars and their labels
+        c = self.canv
         # Simplified representation for proof
         cx = self.width / 2
         cy = self.height / 2
-        
+
         # Two overlapping circles logic represented as bars nicely
         # Draw base bar
         bar_w = 400
         bar_h = 50
         x_start = cx - (bar_w/2)
         y_start = cy - (bar_h/2)
-        
+
         # Engaged (Left)
-        d.add(Rect(x_start, y_start, 120, bar_h, fillColor=DARK_BG, strokeWidth=0))
-        d.add(String(x_start + 60, y_start + 20, "ENGAGED", textAnchor="middle", fillColor=white, fontName="Helvetica-Bold", fontSize=10))
-        
+        c.setFillColor(DARK_BG)
+        c.rect(x_start, y_start, 120, bar_h, fill=1, stroke=0)
+
         # Phantom (Middle - Overlap)
-        d.add(Rect(x_start + 120, y_start, 160, bar_h, fillColor=TEAL_MUTED, strokeColor=TEAL, strokeWidth=2))
-        d.add(String(x_start + 200, y_start + 28, "PHANTOM ENGAGED", textAnchor="middle", fillColor=TEAL, fontName="Helvetica-Bold", fontSize=10))
-        d.add(String(x_start + 200, y_start + 15, "(Uncertainty)", textAnchor="middle", fillColor=TEAL, fontName="Helvetica", fontSize=8))
+        c.setFillColor(TEAL_MUTED)
+        c.setStrokeColor(TEAL)
+        c.setLineWidth(2)
+        c.rect(x_start + 120, y_start, 160, bar_h, fill=1, stroke=1)
+
+        # Unengaged (Right), painted over the right edge of the teal border
+        c.setFillColor(DARK_BG)
+        c.rect(x_start + 280, y_start, 120, bar_h, fill=1, stroke=0)
 
-        # Unengaged (Right)
-        d.add(Rect(x_start + 280, y_start, 120, bar_h, fillColor=DARK_BG, strokeWidth=0))
-        d.add(String(x_start + 340, y_start + 20, "UNENGAGED", textAnchor="middle", fillColor=TEXT_MUTED, fontName="Helvetica-Bold", fontSize=10))
+        c.setFont("Helvetica-Bold", 10)
+        c.setFillColor(white)
+        c.drawCentredString(x_start + 60, y_start + 20, "ENGAGED")
+        c.setFillColor(TEXT_MUTED)
+        c.drawCentredString(x_start + 340, y_start + 20, "UNENGAGED")
+        c.setFillColor(TEAL)
+        c.drawCentredString(x_start + 200, y_start + 28, "PHANTOM ENGAGED")
+        c.setFont("Helvetica", 8)
+        c.drawCentredString(x_start + 200, y_start + 15, "(Uncertainty)")
+
+# ── Static Story ────────────────────────────────────────────
+# Fixed copy, so it is parsed and wrapped once at import
+_EXEC_SUMMARY = (
+    Paragraph("Executive Summary", sH1),
+    Paragraph(
+        "For years, marketers treated opens as a proxy for attention. That proxy is now unreliable at scale. "
+        "Apple Mail Privacy Protection (MPP) is designed to prevent senders from learning about Mail activity by "
+        "downloading remote content in the background, not only when someone views the message.",
+        sNormal
+    ),
+    Paragraph(
+        "This shift creates a practical failure mode: you can no longer confidently distinguish between a quiet, "
+        "loyal reader and a truly disengaged recipient whose client triggered tracking anyway.",
+        sNormal
+    ),
+
+    # Callout Example
+    Spacer(1, 12),
+    ModernCallout(
+        "Phantom Engaged is the name for that uncertainty bucket: an unavoidable overlap created when privacy "
+        "protections break our ability to distinguish silence from disengagement using email metrics alone.",
+        W - 2*MARGIN
+    ),
+    Spacer(1, 12),
 
-        renderPDF.draw(d, self.canv, 0, 0)
+    Paragraph(
+        "The practical solution is not a clever new metric. It is a classification stance: use intentional actions as "
+        "proof of engagement, treat opens as weak evidence, and handle ambiguity conservatively.",
+        sNormal
+    ),
+)
 
 # ── Page Templates ──────────────────────────────────────────
 def draw_cover(canvas, doc):
@@ -136,27 +178,25 @@ def draw_cover(canvas, doc):
     # Full dark background
     canvas.setFillColor(DARK_BG)
     canvas.rect(0, 0, W, H, fill=1, stroke=0)
-    
-    # Hero Accent Line (matches landing page hero::before)
+
+    # Nothing on the cover overlaps, so everything in one colour is drawn
+    # together: one fill change per colour
     canvas.setFillColor(TEAL)
+    # Hero Accent Line (matches landing page hero::before)
     canvas.rect(inch*1.0, inch*1.5, 4, H - inch*3, fill=1, stroke=0)
-    
+    # Subtitle
+    canvas.setFont("Helvetica", 16)
+    canvas.drawString(inch*1.4, H - inch*4.2, "\u2014 The Subscribers Your Dashboard Can't Classify")
+
+    canvas.setFillColor(white)
     # Title
     canvas.setFont("Helvetica-Bold", 42)
-    canvas.setFillColor(white)
     canvas.drawString(inch*1.4, H - inch*3, "Phantom")
     canvas.drawString(inch*1.4, H - inch*3.6, "Engaged")
-    
-    # Subtitle
-    canvas.setFont("Helvetica", 16)
-    canvas.setFillColor(TEAL)
-    canvas.drawString(inch*1.4, H - inch*4.2, "\u2014 The Subscribers Your Dashboard Can't Classify")
-    
     # Author / Meta
     canvas.setFont("Helvetica-Bold", 12)
-    canvas.setFillColor(white)
     canvas.drawString(inch*1.4, inch*1.5, "Chuck Mullaney  |  Expert.Email")
-    
+
     canvas.restoreState()
 
 def draw_content_page(canvas, doc):
@@ -169,8 +209,17 @@ def draw_content_page(canvas, doc):
     canvas.restoreState()
 
 # ── Build ───────────────────────────────────────────────────
+class ProofDoc(BaseDocTemplate):
+    def build(self, flowables, **kw):
+        # _EXEC_SUMMARY is shared between builds: reset its postponed marks
+        for f in flowables:
+            f.__dict__.pop('_postponed', None)
+        BaseDocTemplate.build(self, flowables, **kw)
+
 def build_proof():
-    doc = BaseDocTemplate("Phantom_Engaged_Whitepaper_Proof.pdf", pagesize=letter)
+    # Reproducible output from run to run
+    doc = ProofDoc("Phantom_Engaged_Whitepaper_Proof.pdf", pagesize=letter,
+                   pageCompression=1, invariant=1)
     
     # Frames
     frame_cover = Frame(0, 0, W, H, id='cover', leftPadding=0, rightPadding=0, topPadding=0, bottomPadding=0)
@@ -181,69 +230,44 @@ def build_proof():
         PageTemplate(id='Content', frames=frame_content, onPage=draw_content_page),
     ])
     
-    story = []
-    
-    # -- Page 1: Cover --
-    story.append(NextPageTemplate('Content'))
-    story.append(PageBreak())
-    
-    # -- Page 2: Executive Summary --
-    story.append(Paragraph("Executive Summary", sH1))
-    story.append(Paragraph(
-        "For years, marketers treated opens as a proxy for attention. That proxy is now unreliable at scale. "
-        "Apple Mail Privacy Protection (MPP) is designed to prevent senders from learning about Mail activity by "
-        "downloading remote content in the background, not only when someone views the message.",
-        sNormal
-    ))
-    story.append(Paragraph(
-        "This shift creates a practical failure mode: you can no longer confidently distinguish between a quiet, "
-        "loyal reader and a truly disengaged recipient whose client triggered tracking anyway.",
-        sNormal
-    ))
-    
-    # Callout Example
-    story.append(Spacer(1, 12))
-    story.append(ModernCallout(
-        "Phantom Engaged is the name for that uncertainty bucket: an unavoidable overlap created when privacy "
-        "protections break our ability to distinguish silence from disengagement using email metrics alone.",
-        W - 2*MARGIN
-    ))
-    story.append(Spacer(1, 12))
-    
-    story.append(Paragraph(
-        "The practical solution is not a clever new metric. It is a classification stance: use intentional actions as "
-        "proof of engagement, treat opens as weak evidence, and handle ambiguity conservatively.",
-        sNormal
-    ))
-    
-    # -- Section 1 --
-    story.append(Paragraph("1. What Changed in Measurement", sH1))
-    story.append(Paragraph(
-        "The modern inbox is increasingly built to protect recipients from hidden tracking. Apple’s approach is "
-        "the most explicit: when a user enables Protect Mail Activity, remote content is privately downloaded in "
-        "the background.",
-        sNormal
-    ))
-    
-    # Diagram Proof
-    story.append(Spacer(1, 12))
-    story.append(OverlapDiagram(W - 2*MARGIN))
-    story.append(Spacer(1, 12))
-    
-    # -- Proof of Callout Insertion Capability --
-    story.append(Paragraph("2. A Classification Framework (Proof of Callout)", sH1))
-    story.append(Paragraph(
-        "This is where we would insert your specific callout. Here is what it looks like in this new design:", 
-        sNormal
-    ))
-    
-    story.append(Spacer(1, 12))
-    story.append(ModernCallout(
-        f"<b>Apply this framework to your list.</b> We built a <font color='{TEAL.hexval()}'>free classification tool</font> "
-        "to help you map your subscribers into the A/B/C framework described above. There is no opt-in and no paywall.",
-        W - 2*MARGIN
-    ))
-    
+    # One list display: the story is sized once instead of grown per append
+    story = [
+        # -- Page 1: Cover --
+        NextPageTemplate('Content'),
+        PageBreak(),
+
+        # -- Page 2: Executive Summary --
+        *_EXEC_SUMMARY,
+
+        # -- Section 1 --
+        Paragraph("1. What Changed in Measurement", sH1),
+        Paragraph(
+            "The modern inbox is increasingly built to protect recipients from hidden tracking. Apple’s approach is "
+            "the most explicit: when a user enables Protect Mail Activity, remote content is privately downloaded in "
+            "the background.",
+            sNormal
+        ),
+
+        # Diagram Proof
+        Spacer(1, 12),
+        OverlapDiagram(W - 2*MARGIN),
+        Spacer(1, 12),
+
+        # -- Proof of Callout Insertion Capability --
+        Paragraph("2. A Classification Framework (Proof of Callout)", sH1),
+        Paragraph(
+            "This is where we would insert your specific callout. Here is what it looks like in this new design:",
+            sNormal
+        ),
+
+        Spacer(1, 12),
+        ModernCallout(
+            "<b>Apply this framework to your list.</b> We built a <font color='" + _TEAL_HEX + "'>free classification tool</font> "
+            "to help you map your subscribers into the A/B/C framework described above. There is no opt-in and no paywall.",
+            W - 2*MARGIN
+        ),
+    ]
+
     doc.build(story)
     print("Proof PDF generated: Phantom_Engaged_Whitepaper_Proof.pdf")
 
@@ -8,15 +8,18 @@ Usage:
 """
 
 import sys, os
-from pypdf import PdfReader, PdfWriter
+import functools
+import pikepdf
+from reportlab import rl_config
+from reportlab.pdfbase import pdfmetrics
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
 from reportlab.lib.colors import HexColor, white
 from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.enums import TA_LEFT, TA_JUSTIFY
 from reportlab.platypus import (
-    BaseDocTemplate, PageTemplate, Frame,
-    Paragraph, Spacer, Flowable
+    BaseDocTemplate, PageTemplate, Frame, NextPageTemplate,
+    PageBreak, Paragraph, Spacer, Flowable
 )
 from io import BytesIO
 
@@ -36,6 +39,9 @@ if not os.path.exists(ORIG_PDF):
 
 W, H = letter
 
+# Binary (not ASCII85) streams in the callout pages
+rl_config.useA85 = 0
+
 # ── Colours (matched to v4) ─────────────────────────────────
 TEAL       = HexColor("#3B9B8F")
 DARK_TEXT   = HexColor("#2C3E50")
@@ -44,6 +50,13 @@ LIGHT_TEXT  = HexColor("#8899A6")
 CALLOUT_BG  = HexColor("#F0F5F5")
 LINK_COLOR  = HexColor("#3B9B8F")
 
+# The callout pages link to this placeholder and build() swaps the real
+# URL into the link annotations, so the pages themselves never change
+_TOOL_URL_SLOT  = "{{TOOL_URL}}"
+_LINK_HEX       = LINK_COLOR.hexval()
+_TOOL_LINK_OPEN = '<a href="' + _TOOL_URL_SLOT + '" color="' + _LINK_HEX + '">'
+_TOOL_LINK_HTML = _TOOL_LINK_OPEN + 'Access the free tool here.</a>'
+
 # ── Styles (matched to v4) ──────────────────────────────────
 sCalloutNormal = ParagraphStyle(
     "sCalloutNormal", fontName="Helvetica", fontSize=10.5,
@@ -62,6 +75,30 @@ sBody = ParagraphStyle(
     textColor=DARK_TEXT, alignment=TA_JUSTIFY, spaceAfter=8,
 )
 
+STYLES = {s.name: s for s in (sCalloutNormal, sLinkStyle, sH2, sBody)}
+
+
+@functools.cache
+def _ensure_fonts():
+    """Load the standard fonts the callout pages use, once per process.
+
+    Any future registerFont calls belong here so repeated builds don't
+    redo them.
+    """
+    for name in ("Helvetica", "Helvetica-Bold"):
+        pdfmetrics.getFont(name)
+
+
+_ensure_fonts()
+
+
+@functools.lru_cache(maxsize=512)
+def _mk_para(text, style_name, width):
+    """Parsed and wrapped paragraph with its height, cached per width."""
+    p = Paragraph(text, STYLES[style_name])
+    _, ph = p.wrap(width, 10000)
+    return p, ph
+
 
 # ── Custom Flowables ────────────────────────────────────────
 class TealRule(Flowable):
@@ -84,18 +121,19 @@ class CalloutBox(Flowable):
         self.padding = padding
         self.bar_w = 4
         self.avail_width = avail_width
-        self.paras = []
-        for item in paragraphs_data:
-            if isinstance(item, tuple):
-                self.paras.append(Paragraph(item[0], item[1]))
-            else:
-                self.paras.append(Paragraph(item, sCalloutNormal))
         inner_w = avail_width - self.bar_w - self.padding * 2
         self.inner_w = inner_w
+        # (paragraph, height) pairs, already wrapped at inner_w
+        self._wrapped = []
         total_h = 0
-        for p in self.paras:
-            _, ph = p.wrap(inner_w, 10000)
+        for item in paragraphs_data:
+            if isinstance(item, tuple):
+                p, ph = _mk_para(item[0], item[1].name, inner_w)
+            else:
+                p, ph = _mk_para(item, sCalloutNormal.name, inner_w)
+            self._wrapped.append((p, ph))
             total_h += ph + 4
+        self.paras = [p for p, _ in self._wrapped]
         self.box_h = total_h + self.padding * 2 - 4
         self.width = avail_width
         self.height = self.box_h + 8
@@ -109,8 +147,7 @@ class CalloutBox(Flowable):
         c.rect(0, y_base, self.bar_w, self.box_h, fill=1, stroke=0)
         x = self.bar_w + self.padding
         y = y_base + self.box_h - self.padding
-        for p in self.paras:
-            _, ph = p.wrap(self.inner_w, 10000)
+        for p, ph in self._wrapped:
             p.drawOn(c, x, y - ph)
             y -= ph + 4
 
@@ -134,40 +171,74 @@ def draw_footer(canvas, doc, page_num):
     canvas.restoreState()
 
 
-# ── Build a single-page PDF with callout content ────────────
-def make_callout_page(story_items, page_num):
+# ── Build the callout pages in one PDF ──────────────────────
+def make_callout_pages(pages):
+    """One page per (story_items, page_num), in order, from a single build."""
     buf = BytesIO()
     margin = inch * 0.85
 
-    class OnePage(BaseDocTemplate):
+    class CalloutPages(BaseDocTemplate):
         def __init__(self, fh):
             BaseDocTemplate.__init__(self, fh, pagesize=letter,
                 leftMargin=margin, rightMargin=margin,
-                topMargin=inch * 0.75, bottomMargin=inch * 0.85)
-            frame = Frame(margin, inch * 0.85, W - margin*2, H - inch*1.6,
-                          id='main')
+                topMargin=inch * 0.75, bottomMargin=inch * 0.85,
+                # Left uncompressed: pikepdf only re-reads this buffer, and
+                # the final save compresses every stream anyway
+                pageCompression=0,
+                invariant=1)  # reproducible: no timestamp or ID salt
+            # A template per page so each footer carries its own number
             self.addPageTemplates([
-                PageTemplate(id='callout', frames=frame,
-                             onPage=lambda c, d: draw_footer(c, d, page_num))
+                PageTemplate(id=f'callout{i}',
+                             frames=Frame(margin, inch * 0.85, W - margin*2,
+                                          H - inch*1.6, id='main'),
+                             onPage=lambda c, d, n=page_num: draw_footer(c, d, n))
+                for i, (_, page_num) in enumerate(pages)
             ])
 
-    doc = OnePage(buf)
-    doc.build(story_items)
+    story = []
+    for i, (story_items, _) in enumerate(pages):
+        if i:
+            story += [NextPageTemplate(f'callout{i}'), PageBreak()]
+        story += story_items
+
+    doc = CalloutPages(buf)
+    doc.build(story)
     buf.seek(0)
     return buf
 
 
+@functools.cache
+def _callout_pdf():
+    """The two callout pages as PDF bytes, built once per process."""
+    avail_w = W - inch * 1.7
+    # Original has 9 pages (cover=0, content=1-8)
+    # For page numbering: A goes after original page 4 (which shows "Page 3")
+    # so the new A page would logically be ~page 4 area
+    return make_callout_pages([
+        (create_approach_a(avail_w), 3),  # sits between page 3 and 4 content
+        (create_approach_c(avail_w), 8),  # sits after page 7 content
+    ]).getvalue()
+
+
+def _set_tool_url(page, tool_url):
+    """Point the page's placeholder link annotations at tool_url."""
+    for annot in page.obj.get("/Annots", ()):
+        action = annot.get("/A")
+        if action is not None and str(action.get("/URI", "")) == _TOOL_URL_SLOT:
+            action.URI = pikepdf.String(tool_url)
+
+
 # ── Create Approach A page ──────────────────────────────────
 def create_approach_a(avail_w):
     """Callout page inserted after the A/B/C framework (after original page 4)."""
     story = [Spacer(1, 20)]
 
     texts = [
-        (f'<b>Apply this framework to your list.</b>  We built a '
-         f'<a href="{TOOL_URL}" color="{LINK_COLOR.hexval()}">free classification tool</a> '
-         f'to help you map your subscribers into the A/B/C framework described above. There is no opt-in '
-         f'and no paywall\u200a\u2014\u200ajust a practical starting point for teams ready to move from '
-         f'open-based assumptions to intent-based classification.',
+        ('<b>Apply this framework to your list.</b>  We built a '
+         + _TOOL_LINK_OPEN + 'free classification tool</a> '
+         'to help you map your subscribers into the A/B/C framework described above. There is no opt-in '
+         'and no paywall\u200a\u2014\u200ajust a practical starting point for teams ready to move from '
+         'open-based assumptions to intent-based classification.',
          sCalloutNormal),
     ]
     story.append(CalloutBox(texts, avail_w))
@@ -190,53 +261,39 @@ def create_approach_c(avail_w):
     ))
     story.append(Spacer(1, 4))
     story.append(Paragraph(
-        f'There is no opt-in, no paywall, and no sales pitch. It exists to help working marketers '
-        f'put classification discipline into practice.  '
-        f'<a href="{TOOL_URL}" color="{LINK_COLOR.hexval()}">Access the free tool here.</a>',
+        'There is no opt-in, no paywall, and no sales pitch. It exists to help working marketers '
+        'put classification discipline into practice.  ' + _TOOL_LINK_HTML,
         sBody
     ))
     return story
 
 
 # ── Main assembly ───────────────────────────────────────────
-def build():
-    reader = PdfReader(ORIG_PDF)
-    writer = PdfWriter()
-    avail_w = W - inch * 1.7
-
-    # Original has 9 pages (cover=0, content=1-8)
+def build(tool_url=TOOL_URL):
     # Insert A after page index 3 (original page 4 = "Classification Framework")
     # Insert C after page index 7 (original page 8 = "Conclusion + References")
     # then page index 8 (About the Author) follows
 
-    # Build the two callout pages
-    # For page numbering: A goes after original page 4 (which shows "Page 3")
-    # so the new A page would logically be ~page 4 area
-    a_story = create_approach_a(avail_w)
-    a_buf = make_callout_page(a_story, page_num=3)  # sits between page 3 and 4 content
-    a_reader = PdfReader(a_buf)
-
-    c_story = create_approach_c(avail_w)
-    c_buf = make_callout_page(c_story, page_num=8)  # sits after page 7 content
-    c_reader = PdfReader(c_buf)
-
-    # Assemble
-    for i in range(len(reader.pages)):
-        writer.add_page(reader.pages[i])
+    # QPDF reads the inserted pages' streams from the callout PDF when it
+    # writes, so both sources stay open until the save is done
+    with pikepdf.open(ORIG_PDF) as pdf, \
+            pikepdf.open(BytesIO(_callout_pdf())) as callouts:
+        for page in callouts.pages:
+            _set_tool_url(page, tool_url)
 
         # After page 4 (index 3), insert Approach A
-        if i == 3:
-            writer.add_page(a_reader.pages[0])
+        pdf.pages.insert(4, callouts.pages[0])
 
-        # After page 8 (index 7), insert Approach C
-        if i == 7:
-            writer.add_page(c_reader.pages[0])
+        # After page 8 (index 7, now shifted to 8 by A), insert Approach C
+        pdf.pages.insert(9, callouts.pages[1])
 
-    with open(OUTPUT, "wb") as f:
-        writer.write(f)
+        # Pack the non-stream objects into compressed object streams;
+        # compress_streams also deflates the raw callout content
+        pdf.save(OUTPUT, compress_streams=True,
+                 object_stream_mode=pikepdf.ObjectStreamMode.generate)
 
     print(f"\n  Generated: {OUTPUT}")
-    print(f"  URL: {TOOL_URL}")
+    print(f"  URL: {tool_url}")
     print(f"  Original pages preserved. Two callout pages inserted.\n")
 
 if __name__ == "__main__":